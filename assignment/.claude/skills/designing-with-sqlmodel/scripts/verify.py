@@ -3,22 +3,42 @@
 import os
 import re
 import sys
-from pathlib import Path
 
-# Fix Unicode encoding on Windows
-if sys.platform == "win32":
+# Fix Unicode encoding on Windows (skipped when stdout has been replaced)
+if sys.platform == "win32" and getattr(sys.stdout, 'reconfigure', None):
     sys.stdout.reconfigure(encoding='utf-8')
 
+REQUIRED_SECTIONS = [
+    '# SQLModel Schema Designer',
+    '## When to Use This Skill',
+    '## Quick Start',
+    '## Core Concepts',
+    '## Key Pattern',
+    '## Database Models',
+    '## Database Connection',
+    '## Instructions',
+    '## Common Patterns',
+]
+# One scan of the body finds every section heading; the lookahead keeps overlapping headings visible
+_SECTIONS_RE = re.compile('(?=(' + '|'.join(re.escape(s) for s in REQUIRED_SECTIONS) + '))')
+_TASK_MODEL_RE = re.compile(r'class Task\((?:SQLModel|TaskBase)')
+
 def verify_skill():
     """Verify SQLModel skill meets standards."""
-    skill_dir = Path(__file__).parent.parent
-    skill_md = skill_dir / "SKILL.md"
+    skill_dir_str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-    if not skill_md.exists():
+    # Plain os.path check so a missing SKILL.md exits before pathlib is imported
+    if not os.path.exists(os.path.join(skill_dir_str, "SKILL.md")):
         print("✗ SKILL.md not found")
         sys.exit(1)
 
-    content = skill_md.read_text(encoding='utf-8')
+    from pathlib import Path
+    skill_dir = Path(skill_dir_str)
+    skill_md = skill_dir / "SKILL.md"
+
+    content = skill_md.read_bytes().decode('utf-8')
+    if '\r' in content:  # newline translation read_text would do
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
 
     # Check frontmatter
     if not content.startswith("---"):
@@ -46,20 +66,9 @@ def verify_skill():
         sys.exit(1)
 
     # Check structure sections
-    required_sections = [
-        '# SQLModel Schema Designer',
-        '## When to Use This Skill',
-        '## Quick Start',
-        '## Core Concepts',
-        '## Key Pattern',
-        '## Database Models',
-        '## Database Connection',
-        '## Instructions',
-        '## Common Patterns',
-    ]
-
     body = content.split('---', 2)[-1]
-    missing_sections = [s for s in required_sections if s not in body]
+    found_sections = set(_SECTIONS_RE.findall(body))
+    missing_sections = [s for s in REQUIRED_SECTIONS if s not in found_sections]
 
     if missing_sections:
         print(f"✗ Missing sections: {', '.join(missing_sections)}")
@@ -72,7 +81,7 @@ def verify_skill():
         sys.exit(1)
 
     # Check for SQLModel patterns
-    if 'class Task(SQLModel' not in body and 'class Task(TaskBase' not in body:
+    if not _TASK_MODEL_RE.search(body):
         print("✗ Missing SQLModel task example")
         sys.exit(1)
 
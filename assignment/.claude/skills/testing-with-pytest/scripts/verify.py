@@ -5,8 +5,8 @@ import re
 import sys
 from pathlib import Path
 
-# Fix Unicode encoding on Windows
-if sys.platform == "win32":
+# Fix Unicode encoding on Windows (skipped when stdout has been replaced)
+if sys.platform == "win32" and getattr(sys.stdout, 'reconfigure', None):
     sys.stdout.reconfigure(encoding='utf-8')
 
 def verify_skill():
@@ -18,7 +18,9 @@ def verify_skill():
         print("✗ SKILL.md not found")
         sys.exit(1)
 
-    content = skill_md.read_text(encoding='utf-8')
+    content = skill_md.read_bytes().decode('utf-8')
+    if '\r' in content:  # newline translation read_text would do
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
 
     # Check frontmatter
     if not content.startswith("---"):
@@ -2,13 +2,30 @@
 """Verify LinkedIn post meets quality standards for engagement."""
 import re
 import sys
-import argparse
-from pathlib import Path
 
-# Fix Unicode encoding on Windows
-if sys.platform == "win32":
+# Fix Unicode encoding on Windows (skipped when stdout has been replaced)
+if sys.platform == "win32" and getattr(sys.stdout, 'reconfigure', None):
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Patterns are compiled once at import instead of on every check
+# Match: "- text" or "* text" or "1. text" or lines starting with caps followed by colon
+_BULLET_RE = re.compile(r'(^[\s]*[-*]\s+.{15,}|^[\s]*\d+\.\s+.{15,}|^[A-Z][a-z]+.*?[:→\-])', re.MULTILINE)
+# Matched against lowercased content, so no re.IGNORECASE
+_NUMBER_RE = re.compile(r'(\d+%|\d+[-/]\d+|[\$£€]\d+|~?\d+\+?(?:\s+(?:users|companies|people|clients|hours|weeks|days|months)))')
+
+PAIN_WORDS = ['problem', 'struggling', 'challenge', 'broken', 'mistake', 'loss', 'wrong']
+INSIGHT_WORDS = ['surprising', 'secret', 'why', 'here\'s', 'discovered', 'learned']
+CTA_KEYWORDS = [
+    'reply', 'comment', 'share', 'dm', 'message', 'discuss', 'let me know', 'what',
+    'tell me', 'your thoughts', 'ask', 'reach out', 'book', 'contact', 'link',
+]
+# Stage alignment (TOFU/MOFU/BOFU indicators)
+FUNNEL_KEYWORDS = {
+    'TOFU': ['trend', 'question', 'framework', 'insight', 'why', 'problem'],
+    'MOFU': ['how', 'guide', 'process', 'step', 'analyze', 'framework', 'methodology'],
+    'BOFU': ['result', 'save', 'reduce', 'improve', 'roi', 'deliver', 'client', 'proven']
+}
+
 def check_structure(content):
     """Check if post has required structural elements."""
     issues = []
@@ -20,58 +37,45 @@ def check_structure(content):
     elif word_count > 600:
         issues.append(f"✗ Too long ({word_count} words). Mobile users will scroll past. Aim for 150-400 words.")
 
-    lines = content.strip().split('\n')
+    lower_content = content.lower()
+    stripped = content.strip()
 
-    # Check for hook in first 2 lines
-    hook_section = '\n'.join(lines[:3]).lower()
+    # Check for hook in first 2 lines (maxsplit avoids splitting the whole post)
+    hook_section = '\n'.join(stripped.split('\n', 3)[:3]).lower()
     has_hook = any([
         '?' in hook_section,  # Question
-        any(word in hook_section for word in ['problem', 'struggling', 'challenge', 'broken', 'mistake', 'loss', 'wrong']),  # Pain
-        any(word in hook_section for word in ['surprising', 'secret', 'why', 'here\'s', 'discovered', 'learned']),  # Insight
+        any(word in hook_section for word in PAIN_WORDS),  # Pain
+        any(word in hook_section for word in INSIGHT_WORDS),  # Insight
     ])
 
     if not has_hook:
         issues.append("✗ No clear hook in first 2-3 lines. Start with a pain point or question.")
 
     # Check for substance (bullets or structured points)
-    # Match: "- text" or "• text" or "* text" or "1. text" or lines starting with caps followed by colon
-    bullet_pattern = r'(^[\s]*[-*]\s+.{15,}|^[\s]*\d+\.\s+.{15,}|^[A-Z][a-z]+.*?[:→\-])'
-    # Also search for bullet character (•) using explicit Unicode
-    substance_lines = []
-    for line in lines:
-        # Check for standard bullets or numbered lists
-        if re.search(bullet_pattern, line, re.MULTILINE):
-            substance_lines.append(line)
-        # Check for bullet point character (•) or other Unicode bullets
-        elif '\u2022' in line or '\u2023' in line or '\u25cf' in line:
-            substance_lines.append(line)
-
-    if len(substance_lines) < 2:
-        issues.append(f"✗ Missing substantive points. Found {len(substance_lines)}, need at least 3 bullets or structured points.")
+    substance_count = 0
+    for line in stripped.split('\n'):
+        # Check for standard bullets or numbered lists, then Unicode bullets (•, ‣, ●)
+        if _BULLET_RE.search(line) or '\u2022' in line or '\u2023' in line or '\u25cf' in line:
+            substance_count += 1
+
+    if substance_count < 2:
+        issues.append(f"✗ Missing substantive points. Found {substance_count}, need at least 3 bullets or structured points.")
 
     # Check for specific number or proof point
-    number_pattern = r'(\d+%|\d+[-/]\d+|[\$£€]\d+|~?\d+\+?(?:\s+(?:users|companies|people|clients|hours|weeks|days|months)))'
-    has_proof = bool(re.search(number_pattern, content, re.IGNORECASE))
+    has_proof = bool(_NUMBER_RE.search(lower_content))
 
     if not has_proof:
         issues.append("✗ No specific proof point (number, statistic, result). Add '40% reduction', '500 companies', etc.")
 
     # Check for CTA
-    cta_pattern = r'(reply|comment|share|dm|message|discuss|let me know|what|tell me|your thoughts|ask|reach out|book|contact|link)'
-    has_cta = bool(re.search(cta_pattern, content, re.IGNORECASE))
+    has_cta = any(keyword in lower_content for keyword in CTA_KEYWORDS)
 
     if not has_cta:
         issues.append("✗ No clear CTA. Ask for comments ('What's your experience?'), shares, or replies.")
 
-    # Check for stage alignment (TOFU/MOFU/BOFU indicators)
-    funnel_keywords = {
-        'TOFU': ['trend', 'question', 'framework', 'insight', 'why', 'problem'],
-        'MOFU': ['how', 'guide', 'process', 'step', 'analyze', 'framework', 'methodology'],
-        'BOFU': ['result', 'save', 'reduce', 'improve', 'roi', 'deliver', 'client', 'proven']
-    }
-
-    matches = {stage: sum(1 for keyword in keywords if keyword in content.lower())
-               for stage, keywords in funnel_keywords.items()}
+    # Check for stage alignment: number of distinct stage keywords present
+    matches = {stage: len({keyword for keyword in keywords if keyword in lower_content})
+               for stage, keywords in FUNNEL_KEYWORDS.items()}
 
     if max(matches.values()) == 0:
         issues.append("⚠ Post doesn't clearly indicate TOFU/MOFU/BOFU stage. Add clearer funnel positioning.")
@@ -79,6 +83,10 @@ def check_structure(content):
     return issues, word_count, matches
 
 def main():
+    # Imported here so importing the module for check functions stays cheap
+    import argparse
+    from pathlib import Path
+
     parser = argparse.ArgumentParser(description='Verify LinkedIn post quality')
     parser.add_argument('--post', type=str, help='Path to post file or post text')
     parser.add_argument('--verbose', action='store_true', help='Show detailed analysis')
@@ -92,7 +100,9 @@ def main():
     try:
         post_path = Path(args.post)
         if post_path.exists():
-            content = post_path.read_text(encoding='utf-8')
+            content = post_path.read_bytes().decode('utf-8')
+            if '\r' in content:  # newline translation read_text would do
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
         else:
             content = args.post
     except Exception:
@@ -2,17 +2,45 @@
 """Verify Upwork proposal meets winning standards for job conversion."""
 import re
 import sys
-import argparse
-from pathlib import Path
 
-# Fix Unicode encoding on Windows
-if sys.platform == "win32":
+# Fix Unicode encoding on Windows (skipped when stdout has been replaced)
+if sys.platform == "win32" and getattr(sys.stdout, 'reconfigure', None):
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Patterns are compiled once at import instead of on every check
+_BULLET_RE = re.compile(r'(^[\s]*[-*]\s+[A-Za-z].{15,}|^[\s]*\d+\.\s+[A-Za-z].{15,})')
+# Proof and rate patterns are matched against lowercased content, so no re.IGNORECASE
+# Proof point: percentage, count, or quantified result
+_PROOF_RES = [re.compile(p) for p in (
+    r'\d+%',  # Percentage
+    r'\d+\+?\s+(?:clients|companies|projects|users|hours)',  # Count
+    r'(?:reduced|improved|increased|optimized|fixed).*?\d+',  # Result with number
+    r'(?:https?://\S+|portfolio|case study|link)',  # Proof link
+)]
+_RATE_RE = re.compile(r'(\$\d+|hourly|fixed|rate|pricing)')
+
+GENERIC_PHRASES = [
+    'i am a talented',
+    'i have experience',
+    'i am an expert',
+    'my name is',
+    'thanks for the opportunity',
+    'interested in this project',
+]
+SPECIFIC_KEYWORDS = [
+    'you mentioned', 'i see your', 'i notice', 'your ', 'based on your',
+    'your project', 'specifically', 'particular', 'specific'
+]
+MILESTONE_KEYWORDS = ['milestone', 'first week', 'within', 'days', 'by', 'complete']
+TIMELINE_KEYWORDS = ['week', 'days', 'hours', 'start', 'available']
+ENGAGEMENT_KEYWORDS = ['question', 'discuss', 'chat', 'call', 'talk', 'next', 'schedule', 'available', 'ready']
+
 def check_proposal_quality(content):
     """Check if proposal has winning elements."""
     issues = []
 
+    lower_content = content.lower()
+
     # Check length (should be 150-300 words, min 80, max 350)
     word_count = len(content.split())
     if word_count < 80:
@@ -21,97 +49,74 @@ def check_proposal_quality(content):
         issues.append(f"✗ Too long ({word_count} words). Clients won't read on mobile. Aim for 150-300 words.")
 
     # Check for specific opening (not generic)
-    opening_lines = '\n'.join(content.split('\n')[:3]).lower()
-    generic_phrases = [
-        'i am a talented',
-        'i have experience',
-        'i am an expert',
-        'my name is',
-        'thanks for the opportunity',
-        'interested in this project',
-    ]
-
-    is_generic = any(phrase in opening_lines for phrase in generic_phrases)
+    opening_lines = '\n'.join(lower_content.split('\n', 3)[:3])
+    is_generic = any(phrase in opening_lines for phrase in GENERIC_PHRASES)
     if is_generic:
         issues.append("✗ Opening is generic. Start with client's specific pain or project detail (e.g., 'I see your checkout is timing out...')")
 
     # Check for specific problem mention (shows you read the job)
-    specific_keywords = [
-        'you mentioned', 'i see your', 'i notice', 'your ', 'based on your',
-        'your project', 'your ', 'specifically', 'particular', 'specific'
-    ]
-    has_specificity = any(keyword in opening_lines for keyword in specific_keywords)
+    has_specificity = any(keyword in opening_lines for keyword in SPECIFIC_KEYWORDS)
 
     if not has_specificity:
         issues.append("✗ No specific mention of their project/problem. Reference 2 details from their job post.")
 
     # Check for deliverable bullets (3-4)
-    bullet_pattern = r'(^[\s]*[-*]\s+[A-Za-z].{15,}|^[\s]*\d+\.\s+[A-Za-z].{15,})'
-    bullets = []
+    bullet_count = 0
     for line in content.split('\n'):
-        if re.search(bullet_pattern, line):
-            bullets.append(line)
+        if _BULLET_RE.search(line):
+            bullet_count += 1
         # Check for bullet point character (•) or other Unicode bullets
-        elif '\u2022' in line or '\u2023' in line or '\u25cf' in line:
-            if len(line) > 20:  # Must have substantive content
-                bullets.append(line)
+        elif len(line) > 20 and ('\u2022' in line or '\u2023' in line or '\u25cf' in line):
+            bullet_count += 1
 
-    if len(bullets) < 3:
-        issues.append(f"✗ Only {len(bullets)} bullets found. Need 3-4 clear deliverables (e.g., 'Optimize database queries', 'Set up caching layer').")
+    if bullet_count < 3:
+        issues.append(f"✗ Only {bullet_count} bullets found. Need 3-4 clear deliverables (e.g., 'Optimize database queries', 'Set up caching layer').")
 
     # Check for milestone (testable outcome)
-    milestone_keywords = ['milestone', 'first week', 'within', 'days', 'by', 'complete']
-    has_milestone = any(keyword in content.lower() for keyword in milestone_keywords)
+    has_milestone = any(keyword in lower_content for keyword in MILESTONE_KEYWORDS)
 
     if not has_milestone:
         issues.append("✗ No testable first milestone. Add: 'First milestone: [specific deliverable] within X days.'")
 
     # Check for proof point (number + credibility)
-    # Pattern: percentage, count, or quantified result
-    proof_patterns = [
-        r'\d+%',  # Percentage
-        r'\d+\+?\s+(?:clients|companies|projects|users|hours)',  # Count
-        r'(?:reduced|improved|increased|optimized|fixed).*?\d+',  # Result with number
-        r'(?:https?://\S+|portfolio|case study|link)',  # Proof link
-    ]
-
-    has_proof = any(re.search(pattern, content, re.IGNORECASE) for pattern in proof_patterns)
+    has_proof = any(proof_re.search(lower_content) for proof_re in _PROOF_RES)
 
     if not has_proof:
         issues.append("✗ No proof point (number + result or link). Add: 'Reduced load time by 45%' or link to relevant work.")
 
     # Check for timeline (concrete, not vague)
-    timeline_keywords = ['week', 'days', 'hours', 'start', 'available']
-    has_timeline = any(keyword in content.lower() for keyword in timeline_keywords)
+    has_timeline = any(keyword in lower_content for keyword in TIMELINE_KEYWORDS)
 
     if not has_timeline:
         issues.append("✗ No concrete timeline. Add: 'Timeline: 2 weeks' or 'Available to start by [date]'")
 
     # Check for rate/pricing mention (optional but good)
-    rate_pattern = r'(\$\d+|hourly|fixed|rate|pricing)'
-    has_rate = bool(re.search(rate_pattern, content, re.IGNORECASE))
+    has_rate = bool(_RATE_RE.search(lower_content))
 
     if not has_rate:
         # Not critical but good practice
         issues.append("⚠ No rate/pricing mentioned. Consider adding: 'Rate: $X/hr' or 'Fixed: $Y'")
 
     # Check for mobile-friendliness (no huge paragraphs)
-    lines = content.split('\n')
-    huge_paragraphs = [line for line in lines if len(line) > 120 and not line.strip().startswith(('•', '-', '*', '1.', '2.', '3.', '4.'))]
+    huge_paragraphs = sum(1 for line in content.split('\n')
+                          if len(line) > 120 and not line.strip().startswith(('•', '-', '*', '1.', '2.', '3.', '4.')))
 
-    if len(huge_paragraphs) > 2:
-        issues.append(f"✗ {len(huge_paragraphs)} long paragraphs (>120 chars). Break into shorter lines for mobile readability.")
+    if huge_paragraphs > 2:
+        issues.append(f"✗ {huge_paragraphs} long paragraphs (>120 chars). Break into shorter lines for mobile readability.")
 
     # Check for engagement (question or next step)
-    engagement_keywords = ['question', 'discuss', 'chat', 'call', 'talk', 'next', 'schedule', 'available', 'ready']
-    has_engagement = any(keyword in content.lower() for keyword in engagement_keywords)
+    has_engagement = any(keyword in lower_content for keyword in ENGAGEMENT_KEYWORDS)
 
     if not has_engagement:
         issues.append("⚠ No engagement question or next step. Close with: 'Happy to discuss' or 'Let's schedule a call'")
 
-    return issues, word_count, len(bullets)
+    return issues, word_count, bullet_count
 
 def main():
+    # Imported here so importing the module for check functions stays cheap
+    import argparse
+    from pathlib import Path
+
     parser = argparse.ArgumentParser(description='Verify Upwork proposal quality')
     parser.add_argument('--proposal', type=str, help='Path to proposal file or proposal text')
     parser.add_argument('--verbose', action='store_true', help='Show detailed analysis')
@@ -125,7 +130,9 @@ def main():
     try:
         proposal_path = Path(args.proposal)
         if proposal_path.exists():
-            content = proposal_path.read_text(encoding='utf-8')
+            content = proposal_path.read_bytes().decode('utf-8')
+            if '\r' in content:  # newline translation read_text would do
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
         else:
             content = args.proposal
     except Exception:
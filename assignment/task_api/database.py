@@ -1,20 +1,50 @@
 """Database configuration and session management."""
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import event
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///tasks.db")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-    echo=False
-)
+def _is_sqlite_file(url):
+    """True for SQLite URLs (any driver) backed by a file rather than memory."""
+    return (
+        url.get_backend_name() == "sqlite"
+        and url.database not in (None, "", ":memory:")
+        and url.query.get("mode") != "memory"
+    )
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL with fewer fsyncs and a larger in-memory cache on each new connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA cache_size=-64000")  # ~64 MB
+    cursor.close()
+
+def build_engine(url):
+    """Create an engine, tuning PRAGMAs when it points at a SQLite file."""
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if "sqlite" in url else {},
+        echo=False
+    )
+    if _is_sqlite_file(engine.url):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+engine = build_engine(DATABASE_URL)
 
 def create_db_and_tables():
     """Create all database tables."""
     SQLModel.metadata.create_all(engine)
 
 def get_session():
-    """Dependency for injecting database session."""
-    with Session(engine) as session:
+    """Dependency for injecting database session.
+
+    Objects are not expired on commit: every column is set Python-side, so
+    handlers can return them without reloading the row.
+    """
+    with Session(engine, expire_on_commit=False) as session:
         yield session
@@ -1,12 +1,13 @@
 """FastAPI Task Management API - Main application."""
 from fastapi import FastAPI, HTTPException, Depends
-from fastapi.middleware.cors import CORSMiddleware
-from sqlmodel import Session, select
-from datetime import datetime
+from fastapi.responses import ORJSONResponse
+from sqlmodel import Session, delete, select, update
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from task_api.database import create_db_and_tables, engine, get_session
-from task_api.models import Task, TaskCreate, TaskRead, TaskUpdate
+from task_api.middleware import FastCORSMiddleware
+from task_api.models import Task, TaskCreate, TaskRead, TaskUpdate, utc_now
 
 # Lifespan events
 @asynccontextmanager
@@ -21,17 +22,12 @@ app = FastAPI(
     title="Task Management API",
     description="Simple CRUD API for managing tasks",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# CORS Middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS Middleware (allow all origins, methods and headers, with credentials)
+app.add_middleware(FastCORSMiddleware)
 
 # Health check
 @app.get("/health")
@@ -49,24 +45,42 @@ def create_task(
     db_task = Task.model_validate(task)
     session.add(db_task)
     session.commit()
-    session.refresh(db_task)
     return db_task
 
+@app.post("/tasks/bulk", response_model=list[TaskRead], status_code=201)
+def bulk_create_tasks(
+    tasks: list[TaskCreate],
+    session: Session = Depends(get_session)
+):
+    """Create several tasks in a single transaction."""
+    db_tasks = [Task.model_validate(task) for task in tasks]
+    session.add_all(db_tasks)
+    session.commit()
+    return db_tasks
+
 # ==================== READ (LIST) ====================
 @app.get("/tasks/", response_model=list[TaskRead])
 def list_tasks(
     session: Session = Depends(get_session),
     skip: int = 0,
     limit: int = 10,
-    completed: bool = None
+    completed: bool = None,
+    after_id: Optional[int] = None
 ):
-    """List all tasks with optional filtering."""
+    """List all tasks with optional filtering.
+
+    Pass the last seen id as after_id for keyset pagination, which avoids
+    walking skipped rows; skip/limit offset pagination is still supported.
+    """
     query = select(Task)
 
     if completed is not None:
         query = query.where(Task.completed == completed)
 
-    query = query.offset(skip).limit(limit)
+    if after_id is not None:
+        query = query.where(Task.id > after_id)
+
+    query = query.order_by(Task.id).offset(skip).limit(limit)
     tasks = session.exec(query).all()
     return tasks
 
@@ -89,20 +103,23 @@ def update_task(
     task_update: TaskUpdate,
     session: Session = Depends(get_session)
 ):
-    """Update a task."""
-    task = session.get(Task, task_id)
+    """Update a task.
+
+    Issues a single UPDATE ... RETURNING instead of loading the row first.
+    """
+    # Update only provided fields, read straight off the model instead of a full dump
+    update_data = {key: getattr(task_update, key) for key in task_update.model_fields_set}
+    statement = (
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**update_data, updated_at=utc_now())
+        .returning(Task)
+    )
+    task = session.exec(statement).scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
-    # Update only provided fields
-    update_data = task_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(task, key, value)
-
-    task.updated_at = datetime.utcnow()
-    session.add(task)
     session.commit()
-    session.refresh(task)
     return task
 
 # ==================== DELETE ====================
@@ -111,12 +128,11 @@ def delete_task(
     task_id: int,
     session: Session = Depends(get_session)
 ):
-    """Delete a task."""
-    task = session.get(Task, task_id)
-    if not task:
+    """Delete a task with a single DELETE, using the rowcount as the existence check."""
+    result = session.exec(delete(Task).where(Task.id == task_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
-    session.delete(task)
     session.commit()
     return None
 
@@ -0,0 +1,65 @@
+"""Lightweight ASGI middleware."""
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+class FastCORSMiddleware:
+    """Permissive CORS: any origin, method and header, with credentials.
+
+    Equivalent to Starlette's CORSMiddleware configured with "*" everywhere and
+    allow_credentials=True, but without its per-request origin matching: the
+    request Origin is echoed back and preflight headers are precomputed.
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 600):
+        self.app = app
+        self.preflight_headers = [
+            (b"access-control-allow-methods", ALLOW_METHODS),
+            (b"access-control-max-age", str(max_age).encode()),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", b"2"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a CORS request
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Credentialed requests cannot use "*", so the origin is echoed back
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+
+        # Preflight: answer directly without reaching the app
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + [(b"vary", b"Origin")] + self.preflight_headers
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+                # Merge into any Vary header the app already set
+                MutableHeaders(scope=message).add_vary_header("Origin")
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
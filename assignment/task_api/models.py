@@ -1,9 +1,14 @@
 """Database and API models using SQLModel."""
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import field_validator
 
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime, matching what SQLite stores."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 # BASE MODEL - shared fields
 class TaskBase(SQLModel):
     """Base task fields shared across models."""
@@ -11,25 +16,31 @@ class TaskBase(SQLModel):
     description: Optional[str] = None
     completed: bool = Field(default=False)
 
-    @field_validator("title")
-    @classmethod
-    def title_not_empty(cls, v):
-        """Ensure title is not just whitespace."""
-        if not v.strip():
-            raise ValueError("Title cannot be empty or whitespace")
-        return v.strip()
-
 # DATABASE MODEL - table=True
 class Task(TaskBase, table=True):
     """Task database model."""
+    # Serves the completed filter and id-ordered pagination in list_tasks
+    __table_args__ = (Index("ix_task_completed_id", "completed", "id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
 # CREATE MODEL - for POST requests
 class TaskCreate(TaskBase):
-    """Model for creating tasks (POST)."""
-    pass
+    """Model for creating tasks (POST).
+
+    Titles are checked here on input only, so stored tasks are not
+    re-validated when serialized as TaskRead.
+    """
+
+    @field_validator("title")
+    @classmethod
+    def title_not_empty(cls, v):
+        """Ensure title is not just whitespace."""
+        if not v.strip():
+            raise ValueError("Title cannot be empty or whitespace")
+        return v.strip()
 
 # UPDATE MODEL - all fields optional
 class TaskUpdate(SQLModel):
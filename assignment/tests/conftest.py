@@ -2,7 +2,6 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import SQLModel, create_engine, Session
-from sqlmodel.pool import StaticPool
 
 from task_api.main import app
 from task_api.database import get_session
@@ -10,37 +9,62 @@ from task_api.database import get_session
 # Test database
 @pytest.fixture(scope="session")
 def engine():
-    """Create in-memory SQLite test database."""
+    """Create shared-cache in-memory SQLite test database.
+
+    SQLAlchemy uses SingletonThreadPool for in-memory URIs, so each thread
+    reuses one pooled connection; that connection keeps the database alive
+    until the engine is disposed.
+    """
     engine = create_engine(
-        "sqlite:///:memory:",
+        "sqlite:///file:test_tasks?mode=memory&cache=shared&uri=true",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
     SQLModel.metadata.create_all(engine)
-    return engine
 
-@pytest.fixture
-def session(engine):
-    """Provide test database session with automatic rollback for isolation."""
+    yield engine
+
+    engine.dispose()
+
+@pytest.fixture(scope="module")
+def connection(engine):
+    """Open one connection and outer transaction per test module."""
     connection = engine.connect()
     transaction = connection.begin()
-    session = Session(bind=connection)
 
-    yield session
+    yield connection
 
-    session.close()
     transaction.rollback()
     connection.close()
 
 @pytest.fixture
-def client(session):
+def session(connection):
+    """Provide test database session rolled back to a per-test SAVEPOINT for isolation."""
+    savepoint = connection.begin_nested()
+    # Session commits release their own SAVEPOINT instead of the outer transaction
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+
+    yield session
+
+    session.close()
+    savepoint.rollback()
+
+@pytest.fixture(scope="module")
+def test_client():
+    """Build the FastAPI test client once per module."""
+    return TestClient(app)
+
+@pytest.fixture
+def client(test_client, session):
     """Provide FastAPI test client with mocked database."""
     def get_session_override():
         return session
 
     app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
+    yield test_client
     app.dependency_overrides.clear()
 
 @pytest.fixture
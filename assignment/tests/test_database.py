@@ -0,0 +1,26 @@
+"""Test database engine configuration."""
+import pytest
+
+from task_api.database import build_engine
+
+def journal_mode(engine):
+    """Return the journal mode of a fresh connection."""
+    with engine.connect() as connection:
+        return connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+
+@pytest.mark.parametrize("scheme", ["sqlite", "sqlite+pysqlite"])
+def test_file_database_uses_wal(tmp_path, scheme):
+    """Test file-backed SQLite gets WAL for plain and driver-qualified URLs"""
+    engine = build_engine(f"{scheme}:///{tmp_path / 'tasks.db'}")
+    try:
+        assert journal_mode(engine) == "wal"
+    finally:
+        engine.dispose()
+
+def test_memory_database_skips_pragmas():
+    """Test in-memory SQLite is left on its default journal mode"""
+    engine = build_engine("sqlite:///:memory:")
+    try:
+        assert journal_mode(engine) == "memory"
+    finally:
+        engine.dispose()
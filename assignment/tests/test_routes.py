@@ -7,6 +7,32 @@ def test_health_check(client):
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
+def test_cors_simple_request(client):
+    """Test CORS headers on a request with an Origin"""
+    response = client.get("/health", headers={"Origin": "http://example.com"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://example.com"
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+def test_cors_no_origin(client):
+    """Test requests without an Origin get no CORS headers"""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert not any(name.startswith("access-control-") for name in response.headers)
+    assert "vary" not in response.headers
+
+def test_cors_preflight(client):
+    """Test CORS preflight OPTIONS request"""
+    response = client.options("/tasks/", headers={
+        "Origin": "http://example.com",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "content-type",
+    })
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://example.com"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "content-type"
+
 # ==================== CREATE ====================
 def test_create_task(client, sample_task):
     """Test POST /tasks/"""
@@ -20,6 +46,25 @@ def test_create_task(client, sample_task):
     assert "created_at" in data
     assert "updated_at" in data
 
+def test_bulk_create_tasks(client, sample_task, sample_task_completed):
+    """Test POST /tasks/bulk"""
+    response = client.post("/tasks/bulk", json=[sample_task, sample_task_completed])
+    assert response.status_code == 201
+    data = response.json()
+    assert [t["title"] for t in data] == [sample_task["title"], sample_task_completed["title"]]
+    assert all("id" in t for t in data)
+
+    response = client.get("/tasks/")
+    assert len(response.json()) == 2
+
+def test_bulk_create_tasks_invalid(client, sample_task):
+    """Test POST /tasks/bulk rejects the batch if any task is invalid"""
+    response = client.post("/tasks/bulk", json=[sample_task, {"title": ""}])
+    assert response.status_code == 422
+
+    response = client.get("/tasks/")
+    assert response.json() == []
+
 def test_create_task_missing_title(client):
     """Test POST /tasks/ with missing title"""
     response = client.post("/tasks/", json={"description": "No title"})
@@ -30,6 +75,12 @@ def test_create_task_empty_title(client):
     response = client.post("/tasks/", json={"title": "", "description": "Empty"})
     assert response.status_code == 422
 
+def test_create_task_strips_title(client):
+    """Test POST /tasks/ trims surrounding whitespace from title"""
+    response = client.post("/tasks/", json={"title": "  Padded  "})
+    assert response.status_code == 201
+    assert response.json()["title"] == "Padded"
+
 # ==================== READ (LIST) ====================
 def test_list_tasks_empty(client):
     """Test GET /tasks/ with no tasks"""
@@ -51,12 +102,10 @@ def test_list_tasks(client, sample_task, sample_task_completed):
 def test_list_tasks_with_skip_limit(client, sample_task):
     """Test GET /tasks/ with pagination"""
     # Create 5 tasks
-    for i in range(5):
-        client.post("/tasks/", json={
-            "title": f"Task {i}",
-            "description": f"Task {i} description",
-            "completed": False
-        })
+    client.post("/tasks/bulk", json=[
+        {"title": f"Task {i}", "description": f"Task {i} description", "completed": False}
+        for i in range(5)
+    ])
 
     # Get first 2
     response = client.get("/tasks/?skip=0&limit=2")
@@ -68,6 +117,22 @@ def test_list_tasks_with_skip_limit(client, sample_task):
     assert response.status_code == 200
     assert len(response.json()) == 2
 
+def test_list_tasks_after_id(client):
+    """Test GET /tasks/ with keyset pagination"""
+    # Create 5 tasks
+    client.post("/tasks/bulk", json=[{"title": f"Task {i}"} for i in range(5)])
+
+    # First page
+    response = client.get("/tasks/?limit=2")
+    assert response.status_code == 200
+    first_page = response.json()
+    assert [t["title"] for t in first_page] == ["Task 0", "Task 1"]
+
+    # Next page starts after the last id seen
+    response = client.get(f"/tasks/?after_id={first_page[-1]['id']}&limit=2")
+    assert response.status_code == 200
+    assert [t["title"] for t in response.json()] == ["Task 2", "Task 3"]
+
 def test_list_tasks_filter_completed(client):
     """Test GET /tasks/ with completed filter"""
     # Create tasks
@@ -102,6 +167,20 @@ def test_get_task(client, sample_task):
     assert data["id"] == task_id
     assert data["title"] == sample_task["title"]
 
+def test_write_timestamps_match_read(client, session, sample_task):
+    """Test POST/PUT responses report the same timestamps as a later GET"""
+    created = client.post("/tasks/", json=sample_task).json()
+    session.expire_all()  # Force the GET to reload the row from the database
+    fetched = client.get(f"/tasks/{created['id']}").json()
+    assert fetched["created_at"] == created["created_at"]
+    assert fetched["updated_at"] == created["updated_at"]
+
+    updated = client.put(f"/tasks/{created['id']}", json={"completed": True}).json()
+    session.expire_all()
+    fetched = client.get(f"/tasks/{created['id']}").json()
+    assert fetched["created_at"] == updated["created_at"]
+    assert fetched["updated_at"] == updated["updated_at"]
+
 def test_get_task_not_found(client):
     """Test GET /tasks/{id} with invalid ID"""
     response = client.get("/tasks/99999")